@@ -26,6 +26,9 @@ class CapacitanceManometer(object):
         'system status': 'EVID_208',
         'full-scale pressure': 'EVID_1103'
     }
+    poll_request = ('<PollRequest>' +
+                    ''.join(f'<V Name="{evid}"/>' for evid in evids.values()) +
+                    '</PollRequest>')
     pressure_units = [
         'full-scale ratio',
         'psi',
@@ -86,11 +89,9 @@ class CapacitanceManometer(object):
         self.address = f"http://{address.lstrip('http://').rstrip('/')}/ToolWeb/Cmd"
         self.session = None
         self.timeout = timeout
-        ids = ''.join(f'<V Name="{evid}"/>' for evid in self.evids.values())
-        body = f'<PollRequest>{ids}</PollRequest>'
         self.request = {
             'headers': {'Content-Type': 'text/xml'},
-            'data': body
+            'data': self.poll_request
         }
 
     async def __aenter__(self):
@@ -117,9 +118,15 @@ class CapacitanceManometer(object):
         return self._process(await self._request())
 
     def _process(self, response):
-        """Convert XML response into a simplified dictionary."""
+        """Convert XML response into a simplified dictionary.
+
+        Accepts either the raw response text or an already-parsed element.
+        """
         state = {}
-        tree = ElementTree.fromstring(response)
+        if isinstance(response, ElementTree.Element):
+            tree = response
+        else:
+            tree = ElementTree.fromstring(response)
         for item in tree.findall('V'):
             evid, value = item.get('Name'), item.text
             key = next(k for k, v in self.evids.items() if v == evid)